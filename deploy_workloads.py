@@ -13,13 +13,19 @@ Both workloads deployed on the same cluster with DR protection.
 """
 
 import argparse
-import copy
+import functools
+import itertools
 import json
 import logging
+import os
+import pickle
 import random
+import re
 import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -27,6 +33,28 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+try:
+    # libyaml-backed loader/dumper; ~10x faster than the pure-Python fallback
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+try:
+    # Optional: orjson parses oc's JSON output several times faster than the
+    # stdlib; both are far cheaper than YAML-parsing 'oc get -o yaml'
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    # Optional: hub lookups go through one persistent authenticated HTTPS
+    # connection instead of paying oc's fork + TLS handshake per call
+    from kubernetes import client as k8s_client, config as k8s_config
+
+    KUBERNETES_SDK_AVAILABLE = True
+except ImportError:
+    KUBERNETES_SDK_AVAILABLE = False
+
 # --- Configuration ---
 
 logging.basicConfig(
@@ -39,6 +67,9 @@ WORKLOAD_DATA_DIR = SCRIPT_DIR / "workload_data"
 OUTPUT_DATA_DIR = SCRIPT_DIR / "output_data"
 CLONE_DIR_NAME = "ocs-workloads"
 OC_CMD = "oc"
+# Server-side apply: the apiserver does the merge (no client-side diff) and
+# re-runs upsert cleanly instead of tripping AlreadyExists
+SSA_FLAGS = ["--server-side", "--field-manager=dr-deploy"]
 
 DEFAULT_GIT_REPO = "https://github.com/red-hat-storage/ocs-workloads.git"
 DEFAULT_GIT_BRANCH = "master"
@@ -61,6 +92,7 @@ class ClusterSelectionStrategy(Enum):
     ROUND_ROBIN = "round_robin"
     RANDOM = "random"
     LEAST_LOADED = "least_loaded"
+    P2C = "p2c"  # Power-of-two-choices: sample two clusters, pick less loaded
     SPECIFIED = "specified"
 
 
@@ -76,9 +108,9 @@ class ClusterConfig:
     workload_count: int = 0  # Track deployed workloads
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorkloadDetails:
-    """Details about a workload type."""
+    """Details about a workload type. Immutable; shared across iterations."""
 
     path: str
     workload: str
@@ -125,6 +157,14 @@ class DeploymentConfig:
     selection_strategy: ClusterSelectionStrategy = ClusterSelectionStrategy.ROUND_ROBIN
     multi_ns_workload: int = 1  # Number of namespaces per workload
     vm_type: str = "vm-pvc"  # VM workload type (vm-pvc, vm-dv, vm-dvt)
+    parallel: int = 1  # Number of workload groups deployed concurrently
+    split_output: bool = False  # One output file per workload vs one combined
+    seed: Optional[int] = None  # Seed for reproducible cluster assignment
+
+    @property
+    def use_default_vm_repo(self) -> bool:
+        """Whether VM secrets for the default public repo are sufficient."""
+        return self.repo == DEFAULT_GIT_REPO or not self.git_token
 
 
 # --- Argument Parsing ---
@@ -136,6 +176,15 @@ class ConfigLoader:
     @staticmethod
     def parse_args() -> argparse.Namespace:
         """Parse command-line arguments and optionally load from config file."""
+        # Tiny bootstrap parser resolves just -config, so the full parser (and
+        # every type converter) runs exactly once instead of twice
+        bootstrap = argparse.ArgumentParser(add_help=False)
+        bootstrap.add_argument("-config", type=Path)
+        known_args, _ = bootstrap.parse_known_args()
+
+        # Load config file if provided
+        config_data = ConfigLoader._load_config_file(known_args.config)
+
         parser = argparse.ArgumentParser(
             description="Deploy workloads to OCP clusters for DR testing.",
             formatter_class=argparse.RawTextHelpFormatter,
@@ -143,13 +192,7 @@ class ConfigLoader:
 
         ConfigLoader._add_arguments(parser)
 
-        # Parse once to get config file path
-        known_args, _ = parser.parse_known_args()
-
-        # Load config file if provided
-        config_data = ConfigLoader._load_config_file(known_args.config)
-
-        # Set defaults from config and parse again
+        # Set defaults from config and parse
         parser.set_defaults(**config_data)
         args = parser.parse_args()
 
@@ -250,11 +293,31 @@ class ConfigLoader:
         )
         parser.add_argument("-git_token", type=str, help="Token for git clone")
 
+        parser.add_argument(
+            "-seed",
+            type=int,
+            help="Seed for the random cluster assignment (reproducible runs)",
+        )
+        parser.add_argument(
+            "-parallel",
+            type=int,
+            default=1,
+            help="Number of workload groups to deploy concurrently (default: 1). "
+            "Deployment is I/O-bound on 'oc' calls, so values of 4-8 give "
+            "near-linear speedup for dist workloads",
+        )
+        parser.add_argument(
+            "-split_output",
+            action="store_true",
+            help="Write one output YAML per workload instead of a single "
+            "combined file",
+        )
+
         # Cluster selection strategy
         parser.add_argument(
             "-cluster_strategy",
             type=str,
-            choices=["round_robin", "random", "least_loaded"],
+            choices=["round_robin", "random", "least_loaded", "p2c"],
             default="round_robin",
             help="Strategy for selecting target cluster for dist workloads (default: round_robin)",
         )
@@ -271,7 +334,7 @@ class ConfigLoader:
 
         logger.info(f"Loading config from {config_path}")
         with open(config_path, "r") as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=SafeLoader) or {}
 
     @staticmethod
     def _post_process_args(args: argparse.Namespace) -> None:
@@ -328,34 +391,41 @@ class ConfigValidator:
             logger.error("Provide them via command line or -config file.")
             sys.exit(1)
 
+    # Incompatible option combinations: (predicate, error message builder).
+    # Checked in one pass so adding a constraint is a one-line change.
+    _INCOMPATIBLE = [
+        (
+            lambda a: a.cg and a.workload_pvc_type == "cephfs",
+            lambda a: "CephFS with CG is not supported.",
+        ),
+        (
+            lambda a: a.workload_pvc_type == "cephfs" and a.workload == "vm",
+            lambda a: "VM workload not supported with CephFS.",
+        ),
+        (
+            lambda a: a.recipe and a.workload_type in ("appset", "sub"),
+            lambda a: f"Recipe does not work with {a.workload_type}.",
+        ),
+        (
+            lambda a: a.deploy_on and a.deploy_on not in (a.c1_name, a.c2_name),
+            lambda a: (
+                f"Invalid deploy_on cluster: {a.deploy_on}. "
+                f"Must be {a.c1_name} or {a.c2_name}"
+            ),
+        ),
+        (
+            lambda a: a.multi_ns_workload > 1 and a.workload_type != "dist",
+            lambda a: "-multi_ns_workload is only supported with -workload_type dist",
+        ),
+    ]
+
     @staticmethod
     def _check_compatibility(args: argparse.Namespace) -> None:
         """Check for incompatible configuration combinations."""
-        if args.cg and args.workload_pvc_type == "cephfs":
-            logger.error("❌ CephFS with CG is not supported.")
-            sys.exit(1)
-
-        if args.workload_pvc_type == "cephfs" and args.workload == "vm":
-            logger.error("❌ VM workload not supported with CephFS.")
-            sys.exit(1)
-
-        if args.recipe and args.workload_type in ("appset", "sub"):
-            logger.error(f"❌ Recipe does not work with {args.workload_type}.")
-            sys.exit(1)
-
-        # Validate deploy_on cluster name if specified
-        if args.deploy_on and args.deploy_on not in [args.c1_name, args.c2_name]:
-            logger.error(
-                f"❌ Invalid deploy_on cluster: {args.deploy_on}. Must be {args.c1_name} or {args.c2_name}"
-            )
-            sys.exit(1)
-
-        # Validate multi_ns_workload with workload_type
-        if args.multi_ns_workload > 1 and args.workload_type != "dist":
-            logger.error(
-                "❌ -multi_ns_workload is only supported with -workload_type dist"
-            )
-            sys.exit(1)
+        for predicate, message in ConfigValidator._INCOMPATIBLE:
+            if predicate(args):
+                logger.error(f"❌ {message(args)}")
+                sys.exit(1)
 
     @staticmethod
     def _ensure_output_dir(args: argparse.Namespace) -> None:
@@ -365,14 +435,37 @@ class ConfigValidator:
     @staticmethod
     def _valdiate_managedclusters(args: argparse.Namespace) -> None:
         """Ensure output directory exists."""
+        cluster_names = [args.c1_name, args.c2_name]
         validation_failed_list = []
-        for cl_names in [args.c1_name, args.c2_name]:
-            logger.info(f"Validation Cluser name {cl_names}")
-            try:
-                OpenShiftClient.run_command(["get", "managedclusters", cl_names])
-                logger.info(f"✅ Managedcluster Validation Passed {cl_names} ")
-            except subprocess.CalledProcessError:
-                validation_failed_list.append(cl_names)
+        api = OpenShiftClient.hub_api()
+        if api is not None:
+            for cl_names in cluster_names:
+                logger.info(f"Validation Cluser name {cl_names}")
+                try:
+                    api.get_cluster_custom_object(
+                        "cluster.open-cluster-management.io",
+                        "v1",
+                        "managedclusters",
+                        cl_names,
+                    )
+                    logger.info(f"✅ Managedcluster Validation Passed {cl_names} ")
+                except Exception:
+                    validation_failed_list.append(cl_names)
+        else:
+            # One listing covers both clusters: oc prints the resources it
+            # finds and errors per missing name, so parse stdout with
+            # check=False instead of probing each cluster separately
+            result = OpenShiftClient.run_command(
+                ["get", "managedclusters"] + cluster_names + ["-o", "name"],
+                check=False,
+            )
+            found = {line.rsplit("/", 1)[-1] for line in result.stdout.split()}
+            for cl_names in cluster_names:
+                logger.info(f"Validation Cluser name {cl_names}")
+                if cl_names in found:
+                    logger.info(f"✅ Managedcluster Validation Passed {cl_names} ")
+                else:
+                    validation_failed_list.append(cl_names)
 
         if validation_failed_list:
             logger.error(
@@ -397,45 +490,64 @@ class ClusterSelector:
         self.cluster2 = cluster2
         self.strategy = strategy
         self.specified_cluster = specified_cluster
-        self._round_robin_counter = 0
+        self._clusters = (cluster1, cluster2)
+        self._rr_iter = itertools.cycle(self._clusters)
+        self._lock = threading.Lock()  # Guards selection state under parallel deployment
 
     def select_cluster(self) -> ClusterConfig:
         """Select cluster based on configured strategy."""
         if self.specified_cluster:
             cluster = self._get_cluster_by_name(self.specified_cluster)
-            logger.debug(f"Using specified cluster: {cluster.name}")
+            logger.debug("Using specified cluster: %s", cluster.name)
             return cluster
 
-        if self.strategy == ClusterSelectionStrategy.ROUND_ROBIN:
-            return self._select_round_robin()
-        elif self.strategy == ClusterSelectionStrategy.RANDOM:
-            return self._select_random()
-        elif self.strategy == ClusterSelectionStrategy.LEAST_LOADED:
-            return self._select_least_loaded()
-        else:
-            return self._select_round_robin()
+        with self._lock:
+            if self.strategy == ClusterSelectionStrategy.ROUND_ROBIN:
+                return self._select_round_robin()
+            elif self.strategy == ClusterSelectionStrategy.RANDOM:
+                return self._select_random()
+            elif self.strategy == ClusterSelectionStrategy.LEAST_LOADED:
+                return self._select_least_loaded()
+            elif self.strategy == ClusterSelectionStrategy.P2C:
+                return self._select_p2c()
+            else:
+                return self._select_round_robin()
+
+    def record_deployment(self, cluster: ClusterConfig) -> None:
+        """Record a finished deployment so least-loaded selection stays accurate."""
+        with self._lock:
+            cluster.workload_count += 1
 
     def _select_round_robin(self) -> ClusterConfig:
         """Select cluster using round-robin strategy."""
-        cluster = self.cluster1 if self._round_robin_counter % 2 == 0 else self.cluster2
-        self._round_robin_counter += 1
-        logger.debug(f"Round-robin selected: {cluster.name}")
+        cluster = next(self._rr_iter)
+        logger.debug("Round-robin selected: %s", cluster.name)
         return cluster
 
     def _select_random(self) -> ClusterConfig:
         """Select cluster randomly."""
-        cluster = random.choice([self.cluster1, self.cluster2])
-        logger.debug(f"Randomly selected: {cluster.name}")
+        cluster = random.choice(self._clusters)
+        logger.debug("Randomly selected: %s", cluster.name)
         return cluster
 
     def _select_least_loaded(self) -> ClusterConfig:
-        """Select cluster with fewer workloads."""
-        if self.cluster1.workload_count <= self.cluster2.workload_count:
-            cluster = self.cluster1
-        else:
-            cluster = self.cluster2
+        """Select the cluster with the fewest workloads (full scan)."""
+        cluster = min(self._clusters, key=lambda c: c.workload_count)
+        logger.debug(
+            "Least loaded selected: %s (count: %d)", cluster.name, cluster.workload_count
+        )
+        return cluster
+
+    def _select_p2c(self) -> ClusterConfig:
+        """Power-of-two-choices: sample two clusters, pick the less loaded.
+
+        With two clusters this equals least_loaded; with a larger pool it
+        stays O(1) per selection while keeping the load near-balanced.
+        """
+        a, b = random.sample(self._clusters, 2)
+        cluster = a if a.workload_count <= b.workload_count else b
         logger.debug(
-            f"Least loaded selected: {cluster.name} (count: {cluster.workload_count})"
+            "P2C selected: %s (count: %d)", cluster.name, cluster.workload_count
         )
         return cluster
 
@@ -456,12 +568,20 @@ class WorkloadManager:
     """Manages workload configurations and naming."""
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_details(
         pvc_type: str, workload: str, vm_type: str = "vm-pvc"
     ) -> WorkloadDetails:
-        """Get workload details based on PVC type and workload."""
+        """Get workload details based on PVC type and workload.
+
+        Memoized: WorkloadDetails is frozen, so one shared instance per
+        combination is safe and repeat dispatches cost a dict hit.
+        """
         logger.debug(
-            f"Getting workload details: pvc_type={pvc_type}, workload={workload}, vm_type={vm_type}"
+            "Getting workload details: pvc_type=%s, workload=%s, vm_type=%s",
+            pvc_type,
+            workload,
+            vm_type,
         )
 
         if workload == "busybox":
@@ -518,17 +638,15 @@ class WorkloadManager:
         )
 
     @staticmethod
-    def generate_name(
+    @functools.lru_cache(maxsize=None)
+    def _name_parts(
         workload_type: str,
         workload: str,
-        pvc_type: str,
-        counter: int,
-        ns_dr_prefix: Optional[str] = None,
-        cg: bool = False,
-        recipe: bool = False,
-        multi_ns_index: Optional[int] = None,
-    ) -> str:
-        """Generate a standardized workload/namespace name."""
+        ns_dr_prefix: Optional[str],
+        cg: bool,
+        recipe: bool,
+    ) -> Tuple[str, str, str, str, str]:
+        """Compute the name components that are constant across a run (cached)."""
         # Determine type prefix
         type_prefix = {"appset": "app", "sub": "sub", "dist": "imp"}.get(
             workload_type, "imp"
@@ -541,10 +659,27 @@ class WorkloadManager:
             if workload_type in ("appset", "sub"):
                 type_prefix = "ap"
 
-        # Build name components
         ns_prefix = f"{ns_dr_prefix}-" if ns_dr_prefix else ""
         recipe_prefix = "rp-" if recipe else ""
         cg_suffix = "-cg" if cg else ""
+        return type_prefix, workload_short, ns_prefix, recipe_prefix, cg_suffix
+
+    @staticmethod
+    def generate_name(
+        workload_type: str,
+        workload: str,
+        pvc_type: str,
+        counter: int,
+        ns_dr_prefix: Optional[str] = None,
+        cg: bool = False,
+        recipe: bool = False,
+        multi_ns_index: Optional[int] = None,
+    ) -> str:
+        """Generate a standardized workload/namespace name."""
+        # Only counter and multi_ns_index vary per iteration; the rest is cached
+        type_prefix, workload_short, ns_prefix, recipe_prefix, cg_suffix = (
+            WorkloadManager._name_parts(workload_type, workload, ns_dr_prefix, cg, recipe)
+        )
 
         # Add multi-ns suffix if applicable
         multi_suffix = ""
@@ -554,7 +689,7 @@ class WorkloadManager:
         else:
             name = f"{ns_prefix}{type_prefix}-{workload_short}-{pvc_type}-{recipe_prefix}{counter}{cg_suffix}"
 
-        logger.debug(f"Generated workload name: {name}")
+        logger.debug("Generated workload name: %s", name)
         return name
 
 
@@ -567,10 +702,10 @@ class YAMLHelper:
     @staticmethod
     def load(filepath: Path) -> List[Dict[str, Any]]:
         """Load YAML content from file."""
-        logger.debug(f"Loading YAML: {filepath}")
+        logger.debug("Loading YAML: %s", filepath)
         try:
             with open(filepath, "r") as file:
-                return list(yaml.safe_load_all(file))
+                return list(yaml.load_all(file, Loader=SafeLoader))
         except FileNotFoundError:
             logger.error(f"❌ YAML file not found: {filepath}")
             sys.exit(1)
@@ -578,20 +713,106 @@ class YAMLHelper:
             logger.error(f"❌ Failed to load YAML {filepath}: {e}")
             sys.exit(1)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def load_cached(filepath: Path) -> Tuple[Dict[str, Any], ...]:
+        """Load YAML once per file and cache the parsed documents.
+
+        Templates are loaded for every workload iteration, so parse each file
+        only once per run. Callers must deep-copy documents before mutating.
+        """
+        return tuple(YAMLHelper.load(filepath))
+
+    @staticmethod
+    def clone(data: Any) -> Any:
+        """Fast deep clone for parsed YAML documents.
+
+        A pickle round-trip clones plain dict/list/str trees several times
+        faster than copy.deepcopy.
+        """
+        return pickle.loads(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _pickled_template(filepath: Path, index: int) -> bytes:
+        return pickle.dumps(
+            YAMLHelper.load_cached(filepath)[index], protocol=pickle.HIGHEST_PROTOCOL
+        )
+
+    @staticmethod
+    def clone_template(filepath: Path, index: int = 0) -> Any:
+        """Return a fresh deep copy of a cached template document.
+
+        The pickled blob is cached per file, so per-iteration clones only pay
+        for pickle.loads instead of re-serializing the template every time.
+        """
+        return pickle.loads(YAMLHelper._pickled_template(filepath, index))
+
+    @staticmethod
+    def dump_str(data: List[Dict[str, Any]]) -> str:
+        """Serialize YAML documents to a string (for piping to 'oc ... -f -')."""
+        return yaml.dump_all(data, Dumper=SafeDumper, sort_keys=False, indent=2)
+
     @staticmethod
     def write(data: List[Dict[str, Any]], output_path: Path) -> None:
-        """Write YAML data to file."""
-        logger.debug(f"Writing {len(data)} YAML documents to {output_path}")
+        """Write YAML data to file in a single shot.
+
+        Dumping to a string first turns the dumper's many small writes into
+        one write_text call; large streaming writes go through
+        StreamingYAMLWriter instead.
+        """
+        logger.debug("Writing %d YAML documents to %s", len(data), output_path)
+        if not data:
+            logger.warning(f"⚠ No data to write to {output_path}")
+            return
         try:
-            with open(output_path, "w") as outfile:
-                if data:
-                    yaml.dump_all(data, outfile, sort_keys=False, indent=2)
-                else:
-                    logger.warning(f"⚠ No data to write to {output_path}")
+            output_path.write_text(YAMLHelper.dump_str(data))
         except Exception as e:
             logger.error(f"❌ Failed to write YAML to {output_path}: {e}")
 
 
+class StreamingYAMLWriter:
+    """Incrementally append YAML documents to a single output file.
+
+    Keeps memory flat for large runs: each workload's documents are dumped
+    as they are collected instead of accumulating one big list. The file is
+    opened lazily on first append and appends are lock-guarded so the writer
+    is safe to share across worker threads.
+    """
+
+    def __init__(self, output_path: Path) -> None:
+        self.output_path = output_path
+        self.doc_count = 0
+        self._lock = threading.Lock()
+        self._file = None
+
+    def append(self, docs: List[Dict[str, Any]]) -> None:
+        """Dump documents to the output file."""
+        if not docs:
+            return
+        with self._lock:
+            if self._file is None:
+                # Large buffer: the dumper emits many small writes per document
+                self._file = open(self.output_path, "w", buffering=1024 * 1024)
+            yaml.dump_all(
+                docs,
+                self._file,
+                Dumper=SafeDumper,
+                sort_keys=False,
+                indent=2,
+                explicit_start=True,
+            )
+            self.doc_count += len(docs)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        if self.doc_count == 0:
+            logger.warning("⚠ No YAML documents generated")
+
+
 # --- Git Operations ---
 
 
@@ -600,10 +821,53 @@ class GitHelper:
 
     @staticmethod
     def clone_and_checkout(repo_url: str, clone_path: Path, branch: str) -> None:
-        """Clone repository and checkout specified branch."""
+        """Clone repository and checkout specified branch.
+
+        An existing clone of the same remote is updated with a shallow fetch
+        instead of being removed and re-cloned on every run.
+        """
+        if GitHelper._try_update_existing(repo_url, clone_path, branch):
+            return
         GitHelper._cleanup_existing(clone_path)
         GitHelper._clone(repo_url, clone_path, branch)
 
+    @staticmethod
+    def _try_update_existing(repo_url: str, clone_path: Path, branch: str) -> bool:
+        """Fast path: shallow-fetch the branch into an existing clone."""
+        if not (clone_path / ".git").is_dir():
+            return False
+
+        git_cmd = ["git", "-C", str(clone_path)]
+        try:
+            result = subprocess.run(
+                git_cmd + ["remote", "get-url", "origin"],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            if result.stdout.strip() != repo_url:
+                logger.debug("Existing clone points at a different remote")
+                return False
+
+            logger.info(f"Reusing existing clone at {clone_path} (branch: {branch})")
+            subprocess.run(
+                git_cmd + ["fetch", "--quiet", "--depth", "1", "origin", branch],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            subprocess.run(
+                git_cmd + ["checkout", "--quiet", "--force", "FETCH_HEAD"],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            logger.info("✅ Existing clone updated")
+            return True
+        except subprocess.CalledProcessError as e:
+            logger.warning(f"⚠ Could not reuse existing clone: {e.stderr.strip()}")
+            return False
+
     @staticmethod
     def _cleanup_existing(clone_path: Path) -> None:
         """Remove existing clone directory."""
@@ -625,6 +889,9 @@ class GitHelper:
                     "git",
                     "clone",
                     "--quiet",
+                    "--depth",
+                    "1",
+                    "--single-branch",
                     "--branch",
                     branch,
                     repo_url,
@@ -634,7 +901,7 @@ class GitHelper:
                 capture_output=True,
                 text=True,
             )
-            logger.debug(f"Git stdout: {result.stdout}")
+            logger.debug("Git stdout: %s", result.stdout)
             logger.info("✅ Repository cloned successfully")
         except subprocess.CalledProcessError as e:
             logger.error(f"❌ Failed to clone repository: {e.stderr}")
@@ -647,26 +914,90 @@ class GitHelper:
 class OpenShiftClient:
     """Wrapper for OpenShift CLI operations."""
 
+    _hub_api: Any = None  # Cached CustomObjectsApi for the hub, False if unusable
+
+    @classmethod
+    def hub_api(cls) -> Optional[Any]:
+        """Return a cached kubernetes CustomObjectsApi for the hub, or None.
+
+        Built lazily from the ambient kubeconfig when the optional
+        'kubernetes' package is installed; read-only hub lookups reuse its
+        persistent connection instead of forking 'oc' per call.
+        """
+        if not KUBERNETES_SDK_AVAILABLE:
+            return None
+        if cls._hub_api is None:
+            try:
+                k8s_config.load_kube_config()
+                cls._hub_api = k8s_client.CustomObjectsApi()
+            except Exception as e:
+                logger.debug("kubernetes SDK unusable, falling back to oc: %s", e)
+                cls._hub_api = False
+        return cls._hub_api or None
+
     @staticmethod
     def run_command(
-        cmd_args: List[str], kubeconfig: Optional[str] = None, check: bool = True
+        cmd_args: List[str],
+        kubeconfig: Optional[str] = None,
+        check: bool = True,
+        input_text: Optional[str] = None,
     ) -> subprocess.CompletedProcess:
-        """Execute an 'oc' command."""
+        """Execute an 'oc' command, optionally feeding input_text on stdin."""
         base_cmd = [OC_CMD]
         if kubeconfig:
-            base_cmd.extend(["--kubeconfig", str(kubeconfig)])
+            base_cmd.extend(["--kubeconfig", os.fspath(kubeconfig)])
         base_cmd.extend(cmd_args)
 
-        logger.debug(f"Running: {' '.join(base_cmd)}")
-        result = subprocess.run(base_cmd, capture_output=True, text=True, check=check)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Running: %s", " ".join(base_cmd))
+        result = subprocess.run(
+            base_cmd, capture_output=True, text=True, check=check, input=input_text
+        )
 
-        if result.stderr and check:
-            logger.debug(f"stderr: {result.stderr.strip()}")
-        if result.stdout:
-            logger.debug(f"stdout: {result.stdout.strip()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            if result.stderr and check:
+                logger.debug("stderr: %s", result.stderr.strip())
+            if result.stdout:
+                logger.debug("stdout: %s", result.stdout.strip())
 
         return result
 
+    @staticmethod
+    def run_command_bytes(
+        cmd_args: List[str], kubeconfig: Optional[str] = None
+    ) -> bytes:
+        """Execute an 'oc' command and return raw stdout bytes.
+
+        Skips the text-mode decode for large JSON payloads; orjson parses
+        bytes directly, so the decode would be pure overhead.
+        """
+        base_cmd = [OC_CMD]
+        if kubeconfig:
+            base_cmd.extend(["--kubeconfig", os.fspath(kubeconfig)])
+        base_cmd.extend(cmd_args)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Running: %s", " ".join(base_cmd))
+        result = subprocess.run(base_cmd, capture_output=True, check=True)
+        return result.stdout
+
+    @staticmethod
+    def on_both_clusters(
+        func: Any, cluster1: ClusterConfig, cluster2: ClusterConfig, *args: Any
+    ) -> None:
+        """Run the same oc-backed call against both clusters concurrently.
+
+        Each call is a blocking API round-trip independent of the other, so
+        two workers halve the wall-clock for every c1+c2 pair.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(func, cluster, *args)
+                for cluster in (cluster1, cluster2)
+            ]
+        for future in futures:
+            future.result()
+
     @staticmethod
     def create_project(cluster: ClusterConfig, project_name: str) -> None:
         """Create a project if it doesn't exist."""
@@ -674,16 +1005,48 @@ class OpenShiftClient:
             OpenShiftClient.run_command(
                 ["new-project", project_name], cluster.kubeconfig
             )
-            logger.info(f"✅ Project '{project_name}' created on {cluster.name}")
+            logger.info("✅ Project '%s' created on %s", project_name, cluster.name)
         except subprocess.CalledProcessError as e:
             if "already exists" in e.stderr:
-                logger.info(f"⚠ Project '{project_name}' exists on {cluster.name}")
+                logger.info("⚠ Project '%s' exists on %s", project_name, cluster.name)
             else:
                 logger.error(
                     f"❌ Failed to create project '{project_name}': {e.stderr}"
                 )
                 raise
 
+    @staticmethod
+    def create_namespaces(cluster: ClusterConfig, names: List[str]) -> None:
+        """Create a batch of namespaces with a single 'oc apply' invocation."""
+        docs = [
+            {"apiVersion": "v1", "kind": "Namespace", "metadata": {"name": name}}
+            for name in names
+        ]
+        try:
+            OpenShiftClient.run_command(
+                ["apply", "-f", "-"] + SSA_FLAGS,
+                cluster.kubeconfig,
+                input_text=YAMLHelper.dump_str(docs),
+            )
+            logger.info("✅ Namespace(s) %s ready on %s", names, cluster.name)
+        except subprocess.CalledProcessError as e:
+            logger.error(
+                f"❌ Failed to create namespaces on {cluster.name}: {e.stderr}"
+            )
+            raise
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def render_kustomize(kustomize_path: Path) -> str:
+        """Render a kustomize directory once and cache the manifest text.
+
+        The workload overlay is identical for every namespace, so build it a
+        single time instead of letting 'oc apply -k' re-render per iteration.
+        """
+        logger.debug("Rendering kustomize at %s", kustomize_path)
+        result = OpenShiftClient.run_command(["kustomize", os.fspath(kustomize_path)])
+        return result.stdout
+
     @staticmethod
     def apply_kustomize(
         cluster: ClusterConfig, kustomize_path: Path, namespace: str
@@ -693,62 +1056,134 @@ class OpenShiftClient:
             logger.info(
                 f"Applying kustomize from {kustomize_path} to {namespace} on {cluster.name}"
             )
+            manifest = OpenShiftClient.render_kustomize(kustomize_path)
             OpenShiftClient.run_command(
-                ["apply", "-k", str(kustomize_path), "--namespace", namespace],
+                ["apply", "-f", "-", "--namespace", namespace] + SSA_FLAGS,
                 cluster.kubeconfig,
+                input_text=manifest,
             )
-            logger.info(f"✅ Workload deployed to {namespace} on {cluster.name}")
+            logger.info("✅ Workload deployed to %s on %s", namespace, cluster.name)
         except subprocess.CalledProcessError as e:
             logger.error(f"❌ Failed to apply kustomize: {e.stderr}")
             raise
 
     @staticmethod
     def create_resource(
-        cluster: ClusterConfig, yaml_file: Path, resource_label: str
+        cluster: ClusterConfig,
+        yaml_file: Optional[Path],
+        resource_label: str,
+        yaml_text: Optional[str] = None,
     ) -> None:
-        """Create a resource from YAML file."""
+        """Create a resource from a YAML file, or from YAML text via stdin."""
         try:
-            OpenShiftClient.run_command(
-                ["create", "-f", str(yaml_file)], cluster.kubeconfig
-            )
-            logger.info(f"✅ Created {resource_label} on {cluster.name}")
+            if yaml_text is not None:
+                OpenShiftClient.run_command(
+                    ["create", "-f", "-"], cluster.kubeconfig, input_text=yaml_text
+                )
+            else:
+                OpenShiftClient.run_command(
+                    ["create", "-f", os.fspath(yaml_file)], cluster.kubeconfig
+                )
+            logger.info("✅ Created %s on %s", resource_label, cluster.name)
         except subprocess.CalledProcessError as e:
             if "AlreadyExists" in e.stderr or "already exists" in e.stderr:
-                logger.info(f"⚠ {resource_label} exists on {cluster.name}")
+                logger.info("⚠ %s exists on %s", resource_label, cluster.name)
             else:
                 logger.error(f"❌ Failed to create {resource_label}: {e.stderr}")
                 raise
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_clusterset_name(cluster_name: str) -> Optional[str]:
-        """Get clusterset name for a cluster."""
-        logger.debug(f"Getting clusterset for {cluster_name}")
-        try:
-            result = OpenShiftClient.run_command(
-                ["get", "managedcluster", cluster_name, "-o", "yaml"]
-            )
-            data = yaml.safe_load(result.stdout)
-            clusterset = (
-                data.get("metadata", {})
-                .get("labels", {})
-                .get("cluster.open-cluster-management.io/clusterset")
-            )
-            logger.debug(f"Found clusterset: {clusterset}")
+        """Get clusterset name for a cluster (memoized; invariant per run)."""
+        logger.debug("Getting clusterset for %s", cluster_name)
+        api = OpenShiftClient.hub_api()
+        if api is not None:
+            try:
+                data = api.get_cluster_custom_object(
+                    "cluster.open-cluster-management.io",
+                    "v1",
+                    "managedclusters",
+                    cluster_name,
+                )
+            except Exception as e:
+                logger.error(f"❌ Failed to get clusterset: {e}")
+                sys.exit(1)
+        else:
+            try:
+                # jsonpath returns just the label value; nothing to parse
+                result = OpenShiftClient.run_command(
+                    [
+                        "get",
+                        "managedcluster",
+                        cluster_name,
+                        "-o",
+                        "jsonpath={.metadata.labels.cluster\\.open-cluster-management\\.io/clusterset}",
+                    ]
+                )
+            except subprocess.CalledProcessError as e:
+                logger.error(f"❌ Failed to get clusterset: {e.stderr}")
+                sys.exit(1)
+            clusterset = result.stdout.strip() or None
+            logger.debug("Found clusterset: %s", clusterset)
             return clusterset
-        except subprocess.CalledProcessError as e:
-            logger.error(f"❌ Failed to get clusterset: {e.stderr}")
-            sys.exit(1)
+
+        clusterset = (
+            data.get("metadata", {})
+            .get("labels", {})
+            .get("cluster.open-cluster-management.io/clusterset")
+        )
+        logger.debug("Found clusterset: %s", clusterset)
+        return clusterset
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def validate_drpolicy(drpolicy_name: str) -> None:
-        """Validate that DRPolicy exists."""
-        logger.debug(f"Validating DRPolicy: {drpolicy_name}")
+        """Validate that DRPolicy exists (memoized; invariant per run)."""
+        logger.debug("Validating DRPolicy: %s", drpolicy_name)
+        api = OpenShiftClient.hub_api()
         try:
-            OpenShiftClient.run_command(["get", "drpolicy", drpolicy_name])
+            if api is not None:
+                api.get_cluster_custom_object(
+                    "ramendr.openshift.io", "v1alpha1", "drpolicies", drpolicy_name
+                )
+            else:
+                OpenShiftClient.run_command(["get", "drpolicy", drpolicy_name])
             logger.info(f"✅ DRPolicy '{drpolicy_name}' validated")
         except subprocess.CalledProcessError as e:
             logger.error(f"❌ DRPolicy '{drpolicy_name}' not found: {e.stderr}")
             sys.exit(1)
+        except Exception as e:
+            logger.error(f"❌ DRPolicy '{drpolicy_name}' not found: {e}")
+            sys.exit(1)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _list_resource_names(workload_type: str, kubeconfig: str) -> str:
+        """Fetch the resource-name listing for a workload type once per run.
+
+        Counting for several (pvc_type, workload) combinations reuses the
+        same cached buffer instead of re-listing the whole cluster.
+        """
+        if workload_type == "appset":
+            resource = "ApplicationSet.argoproj.io"
+            cmd_args = ["get", resource, "-A", "-o", "name"]
+        elif workload_type == "sub":
+            resource = "Subscription.apps.open-cluster-management.io"
+            cmd_args = ["get", resource, "-A", "-o", "name"]
+        else:  # dist
+            resource = "namespace"
+            cmd_args = [
+                "get",
+                resource,
+                "--no-headers",
+                "-o",
+                "name",
+                "--kubeconfig",
+                kubeconfig,
+            ]
+
+        return OpenShiftClient.run_command(cmd_args).stdout
 
     @staticmethod
     def get_existing_workload_count(
@@ -757,25 +1192,7 @@ class OpenShiftClient:
         """Get count of existing workloads."""
         logger.debug("Getting existing workload count...")
         try:
-            if workload_type == "appset":
-                resource = "ApplicationSet.argoproj.io"
-                cmd_args = ["get", resource, "-A", "-o", "name"]
-            elif workload_type == "sub":
-                resource = "Subscription.apps.open-cluster-management.io"
-                cmd_args = ["get", resource, "-A", "-o", "name"]
-            else:  # dist
-                resource = "namespace"
-                cmd_args = [
-                    "get",
-                    resource,
-                    "--no-headers",
-                    "-o",
-                    "name",
-                    "--kubeconfig",
-                    kubeconfig,
-                ]
-
-            result = OpenShiftClient.run_command(cmd_args)
+            names = OpenShiftClient._list_resource_names(workload_type, kubeconfig)
 
             # Adjust search terms for CG
             search_workload = workload
@@ -786,15 +1203,17 @@ class OpenShiftClient:
 
             search_prefix = "imp-" if workload_type == "dist" else ""
 
-            count = sum(
-                1
-                for line in result.stdout.splitlines()
-                if search_prefix in line
-                and pvc_type in line
-                and search_workload in line
+            # One compiled multiline scan over the whole buffer instead of
+            # three Python-level substring tests per line
+            pattern = re.compile(
+                rf"^(?=.*{re.escape(search_prefix)})"
+                rf"(?=.*{re.escape(pvc_type)})"
+                rf"(?=.*{re.escape(search_workload)})",
+                re.MULTILINE,
             )
+            count = sum(1 for _ in pattern.finditer(names))
 
-            logger.info(f"Found {count} existing '{workload_type}' workloads")
+            logger.info("Found %d existing '%s' workloads", count, workload_type)
             return count
         except subprocess.CalledProcessError as e:
             logger.error(f"❌ Failed to count existing workloads: {e.stderr}")
@@ -815,11 +1234,12 @@ class VMResourceManager:
         use_default_repo: bool,
     ) -> None:
         """Set up VM resources for both clusters."""
-        logger.info(f"Setting up VM resources for namespace '{namespace}'...")
+        logger.info("Setting up VM resources for namespace '%s'...", namespace)
 
-        # Create projects
-        OpenShiftClient.create_project(cluster1, namespace)
-        OpenShiftClient.create_project(cluster2, namespace)
+        # Create projects on both clusters concurrently
+        OpenShiftClient.on_both_clusters(
+            OpenShiftClient.create_project, cluster1, cluster2, namespace
+        )
 
         # Create secrets
         VMResourceManager._create_vm_secrets(
@@ -827,13 +1247,9 @@ class VMResourceManager:
         )
 
     @staticmethod
-    def _create_vm_secrets(
-        cluster1: ClusterConfig,
-        cluster2: ClusterConfig,
-        namespace: str,
-        use_default_repo: bool,
-    ) -> None:
-        """Create VM secrets on both clusters."""
+    @functools.lru_cache(maxsize=None)
+    def _existing_secret_files(use_default_repo: bool) -> Tuple[Path, ...]:
+        """Resolve which secret template files exist, statting them only once."""
         secret_files = [WORKLOAD_DATA_DIR / "vm-secret.yaml"]
 
         if not use_default_repo:
@@ -844,28 +1260,43 @@ class VMResourceManager:
                 ]
             )
 
-        for secret_file in secret_files:
-            if not secret_file.exists():
-                continue
+        return tuple(path for path in secret_files if path.exists())
+
+    @staticmethod
+    def _create_vm_secrets(
+        cluster1: ClusterConfig,
+        cluster2: ClusterConfig,
+        namespace: str,
+        use_default_repo: bool,
+    ) -> None:
+        """Create VM secrets on both clusters."""
+        # Batch all secrets into one multi-document create per cluster so each
+        # cluster pays a single 'oc' invocation instead of one per secret
+        secret_docs = []
+        for secret_file in VMResourceManager._existing_secret_files(use_default_repo):
+            # Only metadata.namespace changes, so a two-level shallow merge
+            # over the cached template is enough — no deep clone needed
+            secret_data = YAMLHelper.load_cached(secret_file)[0]
+            secret_docs.append(
+                {
+                    **secret_data,
+                    "metadata": {**secret_data["metadata"], "namespace": namespace},
+                }
+            )
 
-            # Load and update secret
-            secret_data = YAMLHelper.load(secret_file)[0]
-            secret_data["metadata"]["namespace"] = namespace
+        if not secret_docs:
+            return
 
-            # Write temporary file
-            temp_path = OUTPUT_DATA_DIR / f"temp-{secret_file.stem}-{namespace}.yaml"
-            YAMLHelper.write([secret_data], temp_path)
+        # Pipe the bundle straight to 'oc create -f -' on both clusters; no
+        # temp file means no filesystem round-trip and no shared-path races
+        secret_text = YAMLHelper.dump_str(secret_docs)
 
-            # Create on both clusters
-            OpenShiftClient.create_resource(
-                cluster1, temp_path, f"{secret_file.stem} in {namespace}"
-            )
+        def create_secrets(cluster: ClusterConfig) -> None:
             OpenShiftClient.create_resource(
-                cluster2, temp_path, f"{secret_file.stem} in {namespace}"
+                cluster, None, f"VM secrets in {namespace}", yaml_text=secret_text
             )
 
-            # Cleanup
-            temp_path.unlink()
+        OpenShiftClient.on_both_clusters(create_secrets, cluster1, cluster2)
 
 
 # --- Distributed Workload Deployer ---
@@ -903,16 +1334,17 @@ class DistributedWorkloadDeployer:
         # Select target cluster (same cluster for all multi-ns workloads)
         target_cluster = self.cluster_selector.select_cluster()
         logger.info(
-            f"📍 Selected cluster: {target_cluster.name} for workload group {counter}"
+            "📍 Selected cluster: %s for workload group %d",
+            target_cluster.name,
+            counter,
         )
         skip_dr_for_vm = (
             self.config.workload == "vm" 
             and self.config.vm_type in ["vm-dv", "vm-dvt", "vm-pvc"]
         )
 
-        # Deploy to multiple namespaces if multi_ns_workload > 1
+        # Resolve every namespace in the group up front so creation can be batched
         for ns_index in range(1, self.config.multi_ns_workload + 1):
-            # Generate namespace name
             if self.config.multi_ns_workload > 1:
                 workload_name = WorkloadManager.generate_name(
                     self.config.workload_type,
@@ -926,16 +1358,36 @@ class DistributedWorkloadDeployer:
                 )
             else:
                 workload_name = base_workload_name
-
             all_namespaces.append(workload_name)
+
+        # Create all namespaces on both clusters (for DR) with one batched
+        # apply per cluster instead of one invocation per namespace
+        try:
+            self._create_namespaces(all_namespaces)
+        except Exception as e:
+            logger.error(f"❌ Failed to create namespaces {all_namespaces}: {e}")
+            return [
+                DeploymentResult(
+                    success=False,
+                    workload_name=ns,
+                    namespace=ns,
+                    cluster_name=target_cluster.name,
+                    error_message=str(e),
+                    multi_ns_index=(
+                        idx if self.config.multi_ns_workload > 1 else None
+                    ),
+                )
+                for idx, ns in enumerate(all_namespaces, start=1)
+            ]
+
+        def deploy_namespace(ns_index: int, workload_name: str) -> DeploymentResult:
             logger.info(
-                f"🚀 Deploying to namespace: {workload_name} on {target_cluster.name}"
+                "🚀 Deploying to namespace: %s on %s",
+                workload_name,
+                target_cluster.name,
             )
 
             try:
-                # Create namespaces on both clusters (for DR)
-                self._create_namespaces(workload_name)
-
                 # Deploy workload to ONLY the selected cluster
                 self._deploy_to_cluster(target_cluster, workload_name)
 
@@ -943,44 +1395,53 @@ class DistributedWorkloadDeployer:
                 if self.workload_details.workload == "vm":
                     self._setup_vm_resources(workload_name)
 
-
                 logger.info(
-                    f"✅ Successfully deployed '{workload_name}' to {target_cluster.name}"
+                    "✅ Successfully deployed '%s' to %s",
+                    workload_name,
+                    target_cluster.name,
                 )
 
-                results.append(
-                    DeploymentResult(
-                        success=True,
-                        workload_name=workload_name,
-                        namespace=workload_name,
-                        cluster_name=target_cluster.name,
-                        yaml_docs=[],  # DR resources created once per group below
-                        multi_ns_index=(
-                            ns_index if self.config.multi_ns_workload > 1 else None
-                        ),
-                    )
+                return DeploymentResult(
+                    success=True,
+                    workload_name=workload_name,
+                    namespace=workload_name,
+                    cluster_name=target_cluster.name,
+                    yaml_docs=[],  # DR resources created once per group below
+                    multi_ns_index=(
+                        ns_index if self.config.multi_ns_workload > 1 else None
+                    ),
                 )
 
             except Exception as e:
-                logger.error(f"❌ Failed to deploy '{workload_name}': {e}")
-                results.append(
-                    DeploymentResult(
-                        success=False,
-                        workload_name=workload_name,
-                        namespace=workload_name,
-                        cluster_name=target_cluster.name,
-                        error_message=str(e),
-                        multi_ns_index=(
-                            ns_index if self.config.multi_ns_workload > 1 else None
-                        ),
-                    )
+                logger.error("❌ Failed to deploy '%s': %s", workload_name, e)
+                return DeploymentResult(
+                    success=False,
+                    workload_name=workload_name,
+                    namespace=workload_name,
+                    cluster_name=target_cluster.name,
+                    error_message=str(e),
+                    multi_ns_index=(
+                        ns_index if self.config.multi_ns_workload > 1 else None
+                    ),
                 )
 
+        # Namespaces in the group are independent and bound on 'oc' I/O;
+        # fan them out and collect in submission order
+        with ThreadPoolExecutor(
+            max_workers=min(8, len(all_namespaces))
+        ) as executor:
+            futures = [
+                executor.submit(deploy_namespace, ns_index, workload_name)
+                for ns_index, workload_name in enumerate(all_namespaces, start=1)
+            ]
+        results.extend(future.result() for future in futures)
+
         # Create DR resources ONCE for ALL namespaces in the group
         if self.config.protect_workload == "yes" and all_namespaces and not skip_dr_for_vm:
             try:
                 logger.info(
-                    f"🔒 Creating DR protection for {len(all_namespaces)} namespace(s)"
+                    "🔒 Creating DR protection for %d namespace(s)",
+                    len(all_namespaces),
                 )
                 yaml_docs = self._create_dr_resources_for_group(
                     all_namespaces, counter, target_cluster, policy_name
@@ -996,31 +1457,35 @@ class DistributedWorkloadDeployer:
             logger.info(f"⚠️  Skipping DR protection for VM type: {self.config.vm_type}")
 
         # Update cluster workload count (once per workload group)
-        target_cluster.workload_count += 1
+        self.cluster_selector.record_deployment(target_cluster)
 
         return results
 
-    def _create_namespaces(self, namespace: str) -> None:
-        """Create namespace on both clusters."""
-        logger.debug(f"Creating namespace '{namespace}' on both clusters...")
-        OpenShiftClient.create_project(self.config.cluster1, namespace)
-        OpenShiftClient.create_project(self.config.cluster2, namespace)
+    def _create_namespaces(self, namespaces: List[str]) -> None:
+        """Create the group's namespaces on both clusters."""
+        logger.debug("Creating namespaces %s on both clusters...", namespaces)
+        OpenShiftClient.on_both_clusters(
+            OpenShiftClient.create_namespaces,
+            self.config.cluster1,
+            self.config.cluster2,
+            namespaces,
+        )
 
     def _deploy_to_cluster(self, cluster: ClusterConfig, namespace: str) -> None:
         """Deploy workload to the specified cluster using kustomize."""
         logger.debug(
-            f"Deploying workload to {cluster.name} in namespace {namespace}..."
+            "Deploying workload to %s in namespace %s...", cluster.name, namespace
         )
         OpenShiftClient.apply_kustomize(cluster, self.kustomize_path, namespace)
 
     def _setup_vm_resources(self, namespace: str) -> None:
 
         """Setup VM resources if workload is VM type."""
-        use_default_repo = (
-            self.config.repo == DEFAULT_GIT_REPO or not self.config.git_token
-        )
         VMResourceManager.setup_vm_resources(
-            self.config.cluster1, self.config.cluster2, namespace, use_default_repo
+            self.config.cluster1,
+            self.config.cluster2,
+            namespace,
+            self.config.use_default_vm_repo,
         )
 
     def _create_dr_resources_for_group(
@@ -1035,7 +1500,7 @@ class DistributedWorkloadDeployer:
         Creates ONE DRPC that protects ALL namespaces in the group.
         """
         logger.debug(
-            f"Creating DR resources for {len(namespaces)} namespace(s): {namespaces}"
+            "Creating DR resources for %d namespace(s): %s", len(namespaces), namespaces
         )
 
         yaml_docs = []
@@ -1057,9 +1522,11 @@ class DistributedWorkloadDeployer:
         else:
             drpc_name = namespaces[0]
 
-        # Load templates
-        placement_template = YAMLHelper.load(WORKLOAD_DATA_DIR / "placement.yaml")[0]
-        drpc_template = YAMLHelper.load(WORKLOAD_DATA_DIR / "drpc.yaml")[0]
+        # Load templates (cached; deep-copy before mutation)
+        placement_template = YAMLHelper.clone_template(
+            WORKLOAD_DATA_DIR / "placement.yaml"
+        )
+        drpc_template = YAMLHelper.clone_template(WORKLOAD_DATA_DIR / "drpc.yaml")
 
         # Update Placement
         placement_template["metadata"]["name"] = f"{drpc_name}-placs-1"
@@ -1074,7 +1541,7 @@ class DistributedWorkloadDeployer:
         # CRITICAL: Set ALL namespaces in protectedNamespaces
         drpc_template["spec"]["protectedNamespaces"] = namespaces
 
-        logger.info(f"  DRPC '{drpc_name}' will protect namespaces: {namespaces}")
+        logger.info("  DRPC '%s' will protect namespaces: %s", drpc_name, namespaces)
 
         # Configure selectors based on recipe or direct protection
         if not self.config.recipe:
@@ -1087,17 +1554,26 @@ class DistributedWorkloadDeployer:
 
         # Add CG annotation if enabled
         if self.config.cg:
-            drpc_template["metadata"].setdefault("annotations", {}).setdefault(
-                "drplacementcontrol.ramendr.openshift.io/is-cg-enabled", "true"
-            )
+            drpc_template["metadata"]["annotations"][
+                "drplacementcontrol.ramendr.openshift.io/is-cg-enabled"
+            ] = "true"
 
         yaml_docs.extend([placement_template, drpc_template])
 
-        # Create recipes if needed (one per namespace)
+        # Create recipes if needed (one per namespace, applied in one batch)
         if self.config.recipe:
-            for namespace in namespaces:
-                recipe_doc = self._create_recipe(namespace)
-                yaml_docs.append(recipe_doc)
+            recipe_docs = [self._build_recipe(namespace) for namespace in namespaces]
+            recipe_text = YAMLHelper.dump_str(recipe_docs)
+            label = f"recipes for {len(namespaces)} namespace(s)"
+            def create_recipes(cluster: ClusterConfig) -> None:
+                OpenShiftClient.create_resource(
+                    cluster, None, label, yaml_text=recipe_text
+                )
+
+            OpenShiftClient.on_both_clusters(
+                create_recipes, self.config.cluster1, self.config.cluster2
+            )
+            yaml_docs.extend(recipe_docs)
 
         return yaml_docs
 
@@ -1117,21 +1593,25 @@ class DistributedWorkloadDeployer:
 
     def _configure_direct_protection(self, drpc: Dict) -> None:
         """Configure DRPC for direct PVC/Pod protection."""
-        pvc_sel = drpc["spec"]["pvcSelector"]["matchExpressions"][0]
-        pvc_sel["key"] = self.workload_details.pvc_selector_key
-        pvc_sel["values"] = [self.workload_details.pvc_selector_value]
-
-        kube_sel = drpc["spec"]["kubeObjectProtection"]["kubeObjectSelector"][
+        wd = self.workload_details
+        spec = drpc["spec"]
+        # Template carries a recipeRef stub for the recipe path; drop it here
+        spec["kubeObjectProtection"].pop("recipeRef", None)
+        pvc_sel = spec["pvcSelector"]["matchExpressions"][0]
+        pvc_sel["key"] = wd.pvc_selector_key
+        pvc_sel["values"] = [wd.pvc_selector_value]
+
+        kube_sel = spec["kubeObjectProtection"]["kubeObjectSelector"][
             "matchExpressions"
         ][0]
-        kube_sel["key"] = self.workload_details.pod_selector_key
-        kube_sel["values"] = [self.workload_details.pod_selector_value]
+        kube_sel["key"] = wd.pod_selector_key
+        kube_sel["values"] = [wd.pod_selector_value]
 
     def _configure_recipe_protection(self, drpc: Dict, workload_name: str) -> None:
         """Configure DRPC for recipe-based protection."""
         drpc["spec"]["pvcSelector"] = {}
         kube_prot = drpc["spec"]["kubeObjectProtection"]
-        kube_prot.setdefault("recipeRef", {})["name"] = workload_name
+        kube_prot["recipeRef"]["name"] = workload_name
         kube_prot["recipeRef"]["namespace"] = workload_name
 
         if "kubeObjectSelector" in kube_prot:
@@ -1149,55 +1629,43 @@ class DistributedWorkloadDeployer:
 
         # For multi-namespace, we use the first namespace's recipe as reference
         # Each namespace will have its own recipe created
-        kube_prot.setdefault("recipeRef", {})["name"] = namespaces[0]
+        kube_prot["recipeRef"]["name"] = namespaces[0]
         kube_prot["recipeRef"]["namespace"] = namespaces[0]
 
         if "kubeObjectSelector" in kube_prot:
             del kube_prot["kubeObjectSelector"]
 
-        logger.debug(f"  Recipe protection configured for {len(namespaces)} namespaces")
+        logger.debug("  Recipe protection configured for %d namespaces", len(namespaces))
+
+    def _build_recipe(self, workload_name: str) -> Dict:
+        """Build the recipe resource for workload protection (caller applies it)."""
+        recipe_template = YAMLHelper.clone_template(WORKLOAD_DATA_DIR / "recipe.yaml")
 
-    def _create_recipe(self, workload_name: str) -> Dict:
-        """Create recipe resource for workload protection."""
-        recipe_template = YAMLHelper.load(WORKLOAD_DATA_DIR / "recipe.yaml")[0]
+        wd = self.workload_details
+        spec = recipe_template["spec"]
 
         recipe_template["metadata"]["name"] = workload_name
-        recipe_template["spec"]["appType"] = self.workload_details.workload
+        spec["appType"] = wd.workload
 
-        group = recipe_template["spec"]["groups"][0]
+        group = spec["groups"][0]
         group["backupRef"] = workload_name
         group["includedNamespaces"] = [workload_name]
         group["name"] = workload_name
 
         group_sel = group["labelSelector"]["matchExpressions"][0]
-        group_sel["key"] = self.workload_details.pod_selector_key
-        group_sel["values"] = [self.workload_details.pod_selector_value]
+        group_sel["key"] = wd.pod_selector_key
+        group_sel["values"] = [wd.pod_selector_value]
 
-        recipe_template["spec"]["workflows"][0]["sequence"][1]["group"] = workload_name
-        recipe_template["spec"]["workflows"][1]["sequence"][0]["group"] = workload_name
-        recipe_template["spec"]["hooks"][0]["namespace"] = workload_name
-        recipe_template["spec"]["hooks"][0][
-            "nameSelector"
-        ] = f"{self.workload_details.workload}-*"
+        spec["workflows"][0]["sequence"][1]["group"] = workload_name
+        spec["workflows"][1]["sequence"][0]["group"] = workload_name
+        spec["hooks"][0]["namespace"] = workload_name
+        spec["hooks"][0]["nameSelector"] = f"{wd.workload}-*"
 
-        vol_spec = recipe_template["spec"]["volumes"]
+        vol_spec = spec["volumes"]
         vol_spec["includedNamespaces"] = [workload_name]
         vol_sel = vol_spec["labelSelector"]["matchExpressions"][0]
-        vol_sel["key"] = self.workload_details.pvc_selector_key
-        vol_sel["values"] = [self.workload_details.pvc_selector_value]
-
-        # Create recipe on both clusters
-        temp_recipe_path = OUTPUT_DATA_DIR / f"temp-recipe-{workload_name}.yaml"
-        YAMLHelper.write([recipe_template], temp_recipe_path)
-
-        OpenShiftClient.create_resource(
-            self.config.cluster1, temp_recipe_path, f"recipe for {workload_name}"
-        )
-        OpenShiftClient.create_resource(
-            self.config.cluster2, temp_recipe_path, f"recipe for {workload_name}"
-        )
-
-        temp_recipe_path.unlink()
+        vol_sel["key"] = wd.pvc_selector_key
+        vol_sel["values"] = [wd.pvc_selector_value]
 
         return recipe_template
 
@@ -1269,6 +1737,7 @@ class WorkloadDeployer:
             config.workload_pvc_type, config.workload, config.vm_type
         )
         self.statistics = DeploymentStatistics(total_requested=config.workload_count)
+        self._git_setup: Optional[Any] = None
 
     def deploy_all(self) -> None:
         """Deploy all workloads."""
@@ -1287,6 +1756,14 @@ class WorkloadDeployer:
                 f"Total namespaces to create: {self.config.workload_count * self.config.multi_ns_workload}"
             )
 
+        # Start the git clone in the background for the dist path; it is
+        # network-bound and independent of the hub lookups below, so total
+        # setup time becomes max(clone, lookups) instead of their sum
+        if self.config.workload_type == "dist":
+            git_executor = ThreadPoolExecutor(max_workers=1)
+            self._git_setup = git_executor.submit(self._setup_git_repo)
+            git_executor.shutdown(wait=False)
+
         # Get policy names
         policy_names = self._get_policy_names()
 
@@ -1300,15 +1777,16 @@ class WorkloadDeployer:
         )
 
         # Deploy based on workload type
-        if self.config.workload_type == "dist":
-            self._deploy_distributed_workloads(current_count, policy_names)
-        elif self.config.workload_type == "appset":
-            self._deploy_applicationset_workloads(current_count, policy_names)
-        elif self.config.workload_type == "sub":
-            self._deploy_subscription_workloads(current_count, policy_names)
-        else:
+        handlers = {
+            "dist": self._deploy_distributed_workloads,
+            "appset": self._deploy_applicationset_workloads,
+            "sub": self._deploy_subscription_workloads,
+        }
+        handler = handlers.get(self.config.workload_type)
+        if handler is None:
             logger.error(f"❌ Unsupported workload type: {self.config.workload_type}")
             sys.exit(1)
+        handler(current_count, policy_names)
 
         # Print summary
         self.statistics.print_summary(
@@ -1325,14 +1803,17 @@ class WorkloadDeployer:
         """Deploy distributed workloads."""
         logger.info(f"\n📦 Deploying DISTRIBUTED workloads...")
 
-        # Setup Git repo
-        kustomize_path = self._setup_git_repo()
+        # Setup Git repo (joins the background clone started in deploy_all)
+        kustomize_path = (
+            self._git_setup.result() if self._git_setup else self._setup_git_repo()
+        )
 
         # Create cluster selector
         strategy_map = {
             "round_robin": ClusterSelectionStrategy.ROUND_ROBIN,
             "random": ClusterSelectionStrategy.RANDOM,
             "least_loaded": ClusterSelectionStrategy.LEAST_LOADED,
+            "p2c": ClusterSelectionStrategy.P2C,
         }
         strategy = strategy_map.get(
             getattr(self.config, "cluster_strategy", "round_robin"),
@@ -1348,22 +1829,12 @@ class WorkloadDeployer:
             self.config, self.workload_details, cluster_selector, kustomize_path
         )
 
-        # Deploy each workload group
-        all_output_yaml = []
-        for i in range(1, self.config.workload_count + 1):
+        workload_names = self._generate_workload_names(current_count)
+
+        def deploy_group(i: int) -> List[DeploymentResult]:
             dynamic_i = current_count + i
             policy_name = policy_names[(i - 1) % len(policy_names)]
-
-            # Generate base workload name (for single namespace mode)
-            base_workload_name = WorkloadManager.generate_name(
-                self.config.workload_type,
-                self.config.workload,
-                self.config.workload_pvc_type,
-                dynamic_i,
-                self.config.ns_dr_prefix,
-                self.config.cg,
-                self.config.recipe,
-            )
+            base_workload_name = workload_names[i - 1]
 
             if self.config.multi_ns_workload > 1:
                 logger.info(f"\n{'='*70}")
@@ -1374,20 +1845,39 @@ class WorkloadDeployer:
                 logger.info(f"{'='*70}")
             else:
                 logger.info(
-                    f"\n--- [{i}/{self.config.workload_count}] Deploying: {base_workload_name} ---"
+                    "\n--- [%d/%d] Deploying: %s ---",
+                    i,
+                    self.config.workload_count,
+                    base_workload_name,
                 )
 
             # Deploy returns list of results (one per namespace)
-            results = deployer.deploy(base_workload_name, dynamic_i, policy_name)
+            return deployer.deploy(base_workload_name, dynamic_i, policy_name)
+
+        # Deploy each workload group; groups are independent and blocked on
+        # 'oc' subprocess I/O, so they can run concurrently
+        max_workers = max(1, min(self.config.parallel, self.config.workload_count))
+        writer = None if self.config.split_output else self._open_combined_output()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(deploy_group, i)
+                for i in range(1, self.config.workload_count + 1)
+            ]
 
-            # Add all results to statistics
-            for result in results:
+        # Collect in submission order so statistics and output are deterministic
+        for future in futures:
+            for result in future.result():
                 self.statistics.add_result(result, self.config.cluster1.name)
                 if result.yaml_docs:
-                    all_output_yaml.extend(result.yaml_docs)
+                    if writer is not None:
+                        writer.append(result.yaml_docs)
+                    else:
+                        self._write_workload_output(
+                            result.workload_name, result.yaml_docs
+                        )
 
-        # Write combined output
-        self._write_combined_output(all_output_yaml)
+        if writer is not None:
+            writer.close()
 
     def _deploy_applicationset_workloads(
         self, current_count: int, policy_names: List[str]
@@ -1401,78 +1891,92 @@ class WorkloadDeployer:
             logger.error(f"❌ Template not found: {template_path}")
             sys.exit(1)
 
-        template_data = YAMLHelper.load(template_path)
+        template_data = YAMLHelper.load_cached(template_path)
 
         # Get repository details
         git_repo = self.config.repo or DEFAULT_GIT_REPO
         git_branch = self.config.repo_branch if self.config.repo else DEFAULT_GIT_BRANCH
 
-        all_output_yaml = []
-        for i in range(1, self.config.workload_count + 1):
-            dynamic_i = current_count + i
-            policy_name = policy_names[(i - 1) % len(policy_names)]
+        # Pre-assign target clusters for the whole run (see -seed)
+        workload_clusters = self._assign_workload_clusters(self.config.workload_count)
 
-            workload_name = WorkloadManager.generate_name(
-                self.config.workload_type,
-                self.config.workload,
-                self.config.workload_pvc_type,
-                dynamic_i,
-                self.config.ns_dr_prefix,
-                self.config.cg,
-                self.config.recipe,
-            )
+        workload_names = self._generate_workload_names(current_count)
+
+        def create_one(i: int) -> Tuple[List[Dict], DeploymentResult]:
+            policy_name = policy_names[(i - 1) % len(policy_names)]
+            workload_name = workload_names[i - 1]
 
             logger.info(
-                f"\n--- [{i}/{self.config.workload_count}] Creating: {workload_name} ---"
+                "\n--- [%d/%d] Creating: %s ---",
+                i,
+                self.config.workload_count,
+                workload_name,
             )
-            
+
             # Setup VM resources if workload is VM type
             if self.workload_details.workload == "vm":
-                use_default_repo = (
-                    self.config.repo == DEFAULT_GIT_REPO or not self.config.git_token
-                )
                 VMResourceManager.setup_vm_resources(
                     self.config.cluster1,
                     self.config.cluster2,
                     workload_name,
-                    use_default_repo
+                    self.config.use_default_vm_repo,
                 )
 
             try:
                 # Update ApplicationSet YAML
                 updated_yaml, workload_cluster = self._update_appset_yaml(
-                    template_data, workload_name, policy_name, git_repo, git_branch
+                    template_data,
+                    workload_name,
+                    policy_name,
+                    git_repo,
+                    git_branch,
+                    workload_clusters[i - 1],
                 )
-                all_output_yaml.extend(updated_yaml)
 
                 logger.info(
-                    f"✅ ApplicationSet '{workload_name}' YAML created for {workload_cluster}"
+                    "✅ ApplicationSet '%s' YAML created for %s",
+                    workload_name,
+                    workload_cluster,
                 )
 
-                # Track deployment in statistics
-                result = DeploymentResult(
+                return list(updated_yaml), DeploymentResult(
                     success=True,
                     workload_name=workload_name,
                     namespace=workload_name,
                     cluster_name=workload_cluster,
                 )
-                self.statistics.add_result(result, self.config.cluster1.name)
 
             except Exception as e:
-                logger.error(f"❌ Failed to create ApplicationSet {workload_name}: {e}")
-                # Track failure
-                result = DeploymentResult(
+                logger.error("❌ Failed to create ApplicationSet %s: %s", workload_name, e)
+                return [], DeploymentResult(
                     success=False,
                     workload_name=workload_name,
                     namespace=workload_name,
                     cluster_name="unknown",
                     error_message=str(e),
                 )
-                self.statistics.add_result(result, self.config.cluster1.name)
-                continue
 
-        # Write combined output
-        self._write_combined_output(all_output_yaml)
+        # VM resource setup blocks on 'oc', so iterations overlap like the
+        # dist path; plain YAML generation just runs serially on one worker
+        max_workers = max(1, min(self.config.parallel, self.config.workload_count))
+        writer = None if self.config.split_output else self._open_combined_output()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(create_one, i)
+                for i in range(1, self.config.workload_count + 1)
+            ]
+
+        # Collect in submission order so statistics and output are deterministic
+        for future in futures:
+            updated_yaml, result = future.result()
+            if writer is not None:
+                writer.append(updated_yaml)
+            elif updated_yaml:
+                self._write_workload_output(result.workload_name, updated_yaml)
+            self.statistics.add_result(result, self.config.cluster1.name)
+
+        if writer is not None:
+            writer.close()
 
     def _deploy_subscription_workloads(
         self, current_count: int, policy_names: List[str]
@@ -1486,66 +1990,111 @@ class WorkloadDeployer:
             logger.error(f"❌ Template not found: {template_path}")
             sys.exit(1)
 
-        template_data = YAMLHelper.load(template_path)
+        template_data = YAMLHelper.load_cached(template_path)
 
         # Get repository details
         git_repo = self.config.repo or DEFAULT_GIT_REPO
         git_branch = self.config.repo_branch if self.config.repo else DEFAULT_GIT_BRANCH
 
-        all_output_yaml = []
-        for i in range(1, self.config.workload_count + 1):
-            dynamic_i = current_count + i
-            policy_name = policy_names[(i - 1) % len(policy_names)]
+        # Pre-assign target clusters for the whole run (see -seed)
+        workload_clusters = self._assign_workload_clusters(self.config.workload_count)
 
-            workload_name = WorkloadManager.generate_name(
-                self.config.workload_type,
-                self.config.workload,
-                self.config.workload_pvc_type,
-                dynamic_i,
-                self.config.ns_dr_prefix,
-                self.config.cg,
-                self.config.recipe,
-            )
+        workload_names = self._generate_workload_names(current_count)
+
+        def create_one(i: int) -> Tuple[List[Dict], DeploymentResult]:
+            policy_name = policy_names[(i - 1) % len(policy_names)]
+            workload_name = workload_names[i - 1]
 
             logger.info(
-                f"\n--- [{i}/{self.config.workload_count}] Creating: {workload_name} ---"
+                "\n--- [%d/%d] Creating: %s ---",
+                i,
+                self.config.workload_count,
+                workload_name,
             )
 
             try:
                 # Update Subscription YAML
                 updated_yaml, workload_cluster = self._update_sub_yaml(
-                    template_data, workload_name, policy_name, git_repo, git_branch
+                    template_data,
+                    workload_name,
+                    policy_name,
+                    git_repo,
+                    git_branch,
+                    workload_clusters[i - 1],
                 )
-                all_output_yaml.extend(updated_yaml)
 
                 logger.info(
-                    f"✅ Subscription '{workload_name}' YAML created for {workload_cluster}"
+                    "✅ Subscription '%s' YAML created for %s",
+                    workload_name,
+                    workload_cluster,
                 )
 
-                # Track deployment in statistics
-                result = DeploymentResult(
+                return list(updated_yaml), DeploymentResult(
                     success=True,
                     workload_name=workload_name,
                     namespace=workload_name,
                     cluster_name=workload_cluster,
                 )
-                self.statistics.add_result(result, self.config.cluster1.name)
 
             except Exception as e:
-                logger.error(f"❌ Failed to create Subscription {workload_name}: {e}")
-                # Track failure
-                result = DeploymentResult(
+                logger.error("❌ Failed to create Subscription %s: %s", workload_name, e)
+                return [], DeploymentResult(
                     success=False,
                     workload_name=workload_name,
                     namespace=workload_name,
                     cluster_name="unknown",
                     error_message=str(e),
                 )
-                self.statistics.add_result(result, self.config.cluster1.name)
-                continue
 
-        # Write combined output
-        self._write_combined_output(all_output_yaml)
+        max_workers = max(1, min(self.config.parallel, self.config.workload_count))
+        writer = None if self.config.split_output else self._open_combined_output()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(create_one, i)
+                for i in range(1, self.config.workload_count + 1)
+            ]
+
+        # Collect in submission order so statistics and output are deterministic
+        for future in futures:
+            updated_yaml, result = future.result()
+            if writer is not None:
+                writer.append(updated_yaml)
+            elif updated_yaml:
+                self._write_workload_output(result.workload_name, updated_yaml)
+            self.statistics.add_result(result, self.config.cluster1.name)
+
+        if writer is not None:
+            writer.close()
+
+    def _generate_workload_names(self, current_count: int) -> List[str]:
+        """Pre-generate every workload name in one pass before the loops."""
+        return [
+            WorkloadManager.generate_name(
+                self.config.workload_type,
+                self.config.workload,
+                self.config.workload_pvc_type,
+                current_count + i,
+                self.config.ns_dr_prefix,
+                self.config.cg,
+                self.config.recipe,
+            )
+            for i in range(1, self.config.workload_count + 1)
+        ]
+
+    def _assign_workload_clusters(self, count: int) -> List[str]:
+        """Pre-assign a target cluster for every workload in one pass.
+
+        Keeps RNG calls out of the per-iteration path and, with -seed,
+        makes the assignment reproducible across runs.
+        """
+        if self.config.deploy_on:
+            return [self.config.deploy_on] * count
+
+        rng = random.Random(self.config.seed) if self.config.seed is not None else random
+        cluster_names = [self.config.cluster1.name, self.config.cluster2.name]
+        # Bind the bound method once; skips per-iteration attribute lookup
+        choice = rng.choice
+        return [choice(cluster_names) for _ in range(count)]
 
     def _setup_git_repo(self) -> Path:
         """Setup Git repository and return kustomize path."""
@@ -1563,7 +2112,10 @@ class WorkloadDeployer:
         # Build kustomize path
         kustomize_path = clone_path / self.workload_details.path
 
-        if not kustomize_path.exists():
+        # Single stat via EAFP instead of the exists() probe
+        try:
+            os.stat(kustomize_path)
+        except FileNotFoundError:
             logger.error(f"❌ Workload path not found: {kustomize_path}")
             sys.exit(1)
 
@@ -1578,9 +2130,10 @@ class WorkloadDeployer:
             return [self.config.drpolicy_name]
 
         try:
-            # Get all DR policies
-            result = OpenShiftClient.run_command(["get", "drpolicy", "-o", "yaml"])
-            policies_data = yaml.safe_load(result.stdout)
+            # Get all DR policies; JSON output skips the YAML parser and only
+            # the name and drClusters fields are read from each item
+            stdout = OpenShiftClient.run_command_bytes(["get", "drpolicy", "-o", "json"])
+            policies_data = json_loads(stdout)
             
             if not policies_data or "items" not in policies_data:
                 logger.error("❌ No DRPolicies found")
@@ -1599,7 +2152,7 @@ class WorkloadDeployer:
                 # Check if policy includes both our clusters
                 if cluster_names.issubset(policy_clusters):
                     matching_policies.append(policy_name)
-                    logger.debug(f"Policy '{policy_name}' includes clusters: {policy_clusters}")
+                    logger.debug("Policy '%s' includes clusters: %s", policy_name, policy_clusters)
             
             if not matching_policies:
                 logger.error(
@@ -1630,8 +2183,8 @@ class WorkloadDeployer:
     def _validate_drpolicy_clusters(self, policy_name: str) -> None:
         """Validate that a DR policy includes both configured clusters."""
         try:
-            result = OpenShiftClient.run_command(["get", "drpolicy", policy_name, "-o", "yaml"])
-            policy_data = yaml.safe_load(result.stdout)
+            result = OpenShiftClient.run_command(["get", "drpolicy", policy_name, "-o", "json"])
+            policy_data = json_loads(result.stdout)
             
             # Get cluster names from the policy spec
             policy_clusters = set(policy_data.get("spec", {}).get("drClusters", []))
@@ -1665,75 +2218,74 @@ class WorkloadDeployer:
         policy_name: str,
         git_repo: str,
         git_branch: str,
+        workload_cluster: str,
     ) -> Tuple[List[Dict], str]:
         """Update ApplicationSet YAML with workload-specific values.
 
         Returns:
             Tuple of (updated_yaml_list, workload_cluster)
         """
-        updated_data = copy.deepcopy(template_data)
+        updated_data = YAMLHelper.clone(template_data)
 
-        # Determine deployment cluster
-        workload_cluster = self.config.deploy_on or random.choice(
-            [self.config.cluster1.name, self.config.cluster2.name]
-        )
         skip_dr_for_vm = (
             self.config.workload == "vm" 
             and self.config.vm_type in ["vm-dv", "vm-dvt", "vm-pvc"]
         )
 
-        for item in updated_data:
-            if item["kind"] == "ApplicationSet":
-                item["metadata"]["name"] = workload_name
-                item["spec"]["generators"][0]["clusterDecisionResource"][
-                    "labelSelector"
-                ]["matchLabels"][
-                    "cluster.open-cluster-management.io/placement"
-                ] = f"{workload_name}-placs"
-                item["spec"]["template"]["metadata"][
-                    "name"
-                ] = f"{workload_name}-{{{{name}}}}"
-                item["spec"]["template"]["spec"]["sources"][0][
-                    "path"
-                ] = self.workload_details.path
-                item["spec"]["template"]["spec"]["sources"][0]["repoURL"] = git_repo
-                item["spec"]["template"]["spec"]["sources"][0][
-                    "targetRevision"
-                ] = git_branch
-                item["spec"]["template"]["spec"]["destination"][
-                    "namespace"
-                ] = workload_name
-
-            elif item["kind"] == "Placement":
-                item["metadata"]["name"] = f"{workload_name}-placs"
-                item["spec"]["predicates"][0]["requiredClusterSelector"][
-                    "labelSelector"
-                ]["matchExpressions"][0]["values"][0] = workload_cluster
-                item["spec"]["clusterSets"][0] = self.config.clusterset
-
-                if self.config.protect_workload == "yes" and not skip_dr_for_vm:
-                    item["metadata"].setdefault("annotations", {}).setdefault(
-                        "cluster.open-cluster-management.io/experimental-scheduling-disable",
-                        "true",
-                    )
+        def _update_applicationset(item: Dict) -> None:
+            item["metadata"]["name"] = workload_name
+            item["spec"]["generators"][0]["clusterDecisionResource"]["labelSelector"][
+                "matchLabels"
+            ]["cluster.open-cluster-management.io/placement"] = f"{workload_name}-placs"
+            item["spec"]["template"]["metadata"]["name"] = f"{workload_name}-{{{{name}}}}"
+            item["spec"]["template"]["spec"]["sources"][0][
+                "path"
+            ] = self.workload_details.path
+            item["spec"]["template"]["spec"]["sources"][0]["repoURL"] = git_repo
+            item["spec"]["template"]["spec"]["sources"][0]["targetRevision"] = git_branch
+            item["spec"]["template"]["spec"]["destination"]["namespace"] = workload_name
+
+        def _update_placement(item: Dict) -> None:
+            item["metadata"]["name"] = f"{workload_name}-placs"
+            item["spec"]["predicates"][0]["requiredClusterSelector"]["labelSelector"][
+                "matchExpressions"
+            ][0]["values"][0] = workload_cluster
+            item["spec"]["clusterSets"][0] = self.config.clusterset
+
+            if self.config.protect_workload == "yes" and not skip_dr_for_vm:
+                item["metadata"].setdefault("annotations", {}).setdefault(
+                    "cluster.open-cluster-management.io/experimental-scheduling-disable",
+                    "true",
+                )
 
-            elif (
-                item["kind"] == "DRPlacementControl"
-                and self.config.protect_workload == "yes"
-            ):
-                item["metadata"]["name"] = f"{workload_name}-placs-drpc"
-                item["spec"]["drPolicyRef"]["name"] = policy_name
-                item["spec"]["placementRef"]["name"] = f"{workload_name}-placs"
-                item["spec"]["preferredCluster"] = workload_cluster
-
-                pvc_sel = item["spec"]["pvcSelector"]["matchExpressions"][0]
-                pvc_sel["key"] = self.workload_details.pvc_selector_key
-                pvc_sel["values"] = [self.workload_details.pvc_selector_value]
-
-                if self.config.cg:
-                    item["metadata"].setdefault("annotations", {}).setdefault(
-                        "drplacementcontrol.ramendr.openshift.io/is-cg-enabled", "true"
-                    )
+        def _update_drpc(item: Dict) -> None:
+            if self.config.protect_workload != "yes":
+                return
+            item["metadata"]["name"] = f"{workload_name}-placs-drpc"
+            item["spec"]["drPolicyRef"]["name"] = policy_name
+            item["spec"]["placementRef"]["name"] = f"{workload_name}-placs"
+            item["spec"]["preferredCluster"] = workload_cluster
+
+            pvc_sel = item["spec"]["pvcSelector"]["matchExpressions"][0]
+            pvc_sel["key"] = self.workload_details.pvc_selector_key
+            pvc_sel["values"] = [self.workload_details.pvc_selector_value]
+
+            if self.config.cg:
+                item["metadata"].setdefault("annotations", {}).setdefault(
+                    "drplacementcontrol.ramendr.openshift.io/is-cg-enabled", "true"
+                )
+
+        # Constant-time dispatch on kind instead of an if/elif chain per item
+        handlers = {
+            "ApplicationSet": _update_applicationset,
+            "Placement": _update_placement,
+            "DRPlacementControl": _update_drpc,
+        }
+
+        for item in updated_data:
+            handler = handlers.get(item["kind"])
+            if handler:
+                handler(item)
 
         # Filter out DRPC if protection is disabled
         if self.config.protect_workload != "yes" or skip_dr_for_vm:
@@ -1752,101 +2304,107 @@ class WorkloadDeployer:
         policy_name: str,
         git_repo: str,
         git_branch: str,
+        workload_cluster: str,
     ) -> Tuple[List[Dict], str]:
         """Update Subscription YAML with workload-specific values.
 
         Returns:
             Tuple of (updated_yaml_list, workload_cluster)
         """
-        updated_data = copy.deepcopy(template_data)
+        updated_data = YAMLHelper.clone(template_data)
 
         channel = f"channel-{workload_name}"
 
-        # Determine deployment cluster
-        workload_cluster = self.config.deploy_on or random.choice(
-            [self.config.cluster1.name, self.config.cluster2.name]
-        )
-
         skip_dr_for_vm = (
             self.config.workload == "vm" 
             and self.config.vm_type in ["vm-dv", "vm-dvt", "vm-pvc"]
         )
 
 
-        for item in updated_data:
-            if item["kind"] == "Namespace":
-                # First namespace is for workload, second for channel
-                if item["metadata"]["name"] in ["sub-rbd-1", "busybox-sub"]:
-                    item["metadata"]["name"] = workload_name
-                else:
-                    item["metadata"]["name"] = channel
-
-            elif item["kind"] == "Application":
+        def _update_namespace(item: Dict) -> None:
+            # First namespace is for workload, second for channel
+            if item["metadata"]["name"] in ["sub-rbd-1", "busybox-sub"]:
                 item["metadata"]["name"] = workload_name
-                item["metadata"]["namespace"] = workload_name
-                item["spec"]["selector"]["matchExpressions"][0]["values"][
-                    0
-                ] = workload_name
-
-            elif item["kind"] == "Channel":
+            else:
                 item["metadata"]["name"] = channel
-                item["metadata"]["namespace"] = channel
-                item["spec"]["pathname"] = git_repo
-
-            elif item["kind"] == "Subscription":
-                item["metadata"]["name"] = f"{workload_name}-sub"
-                item["metadata"]["namespace"] = workload_name
-                item["metadata"]["annotations"][
-                    "apps.open-cluster-management.io/git-branch"
-                ] = git_branch
-                item["metadata"]["annotations"][
-                    "apps.open-cluster-management.io/git-path"
-                ] = self.workload_details.path
-                item["metadata"]["labels"]["app"] = workload_name
-                item["spec"]["channel"] = f"{channel}/{channel}"
-                item["spec"]["placement"]["placementRef"][
-                    "name"
-                ] = f"{workload_name}-placs"
-
-            elif item["kind"] == "Placement":
-                item["metadata"]["labels"]["app"] = workload_name
-                item["metadata"]["name"] = f"{workload_name}-placs"
-                item["metadata"]["namespace"] = workload_name
-                item["spec"]["predicates"][0]["requiredClusterSelector"][
-                    "labelSelector"
-                ]["matchExpressions"][0]["values"][0] = workload_cluster
-                item["spec"]["clusterSets"][0] = self.config.clusterset
-
-                if self.config.protect_workload == "yes" and not skip_dr_for_vm:
-                    item["metadata"].setdefault("annotations", {}).setdefault(
-                        "cluster.open-cluster-management.io/experimental-scheduling-disable",
-                        "true",
-                    )
 
-            elif item["kind"] == "ManagedClusterSetBinding":
-                item["metadata"]["namespace"] = workload_name
-                item["metadata"]["name"] = self.config.clusterset
-                item["spec"]["clusterSet"] = self.config.clusterset
-
-            elif (
-                item["kind"] == "DRPlacementControl"
-                and self.config.protect_workload == "yes"
-            ):
-                item["metadata"]["name"] = f"{workload_name}-placs-drpc"
-                item["metadata"]["namespace"] = workload_name
-                item["spec"]["drPolicyRef"]["name"] = policy_name
-                item["spec"]["placementRef"]["name"] = f"{workload_name}-placs"
-                item["spec"]["placementRef"]["namespace"] = workload_name
-                item["spec"]["preferredCluster"] = workload_cluster
-
-                pvc_sel = item["spec"]["pvcSelector"]["matchExpressions"][0]
-                pvc_sel["key"] = self.workload_details.pvc_selector_key
-                pvc_sel["values"] = [self.workload_details.pvc_selector_value]
-
-                if self.config.cg:
-                    item["metadata"].setdefault("annotations", {}).setdefault(
-                        "drplacementcontrol.ramendr.openshift.io/is-cg-enabled", "true"
-                    )
+        def _update_application(item: Dict) -> None:
+            item["metadata"]["name"] = workload_name
+            item["metadata"]["namespace"] = workload_name
+            item["spec"]["selector"]["matchExpressions"][0]["values"][0] = workload_name
+
+        def _update_channel(item: Dict) -> None:
+            item["metadata"]["name"] = channel
+            item["metadata"]["namespace"] = channel
+            item["spec"]["pathname"] = git_repo
+
+        def _update_subscription(item: Dict) -> None:
+            item["metadata"]["name"] = f"{workload_name}-sub"
+            item["metadata"]["namespace"] = workload_name
+            item["metadata"]["annotations"][
+                "apps.open-cluster-management.io/git-branch"
+            ] = git_branch
+            item["metadata"]["annotations"][
+                "apps.open-cluster-management.io/git-path"
+            ] = self.workload_details.path
+            item["metadata"]["labels"]["app"] = workload_name
+            item["spec"]["channel"] = f"{channel}/{channel}"
+            item["spec"]["placement"]["placementRef"]["name"] = f"{workload_name}-placs"
+
+        def _update_placement(item: Dict) -> None:
+            item["metadata"]["labels"]["app"] = workload_name
+            item["metadata"]["name"] = f"{workload_name}-placs"
+            item["metadata"]["namespace"] = workload_name
+            item["spec"]["predicates"][0]["requiredClusterSelector"]["labelSelector"][
+                "matchExpressions"
+            ][0]["values"][0] = workload_cluster
+            item["spec"]["clusterSets"][0] = self.config.clusterset
+
+            if self.config.protect_workload == "yes" and not skip_dr_for_vm:
+                item["metadata"].setdefault("annotations", {}).setdefault(
+                    "cluster.open-cluster-management.io/experimental-scheduling-disable",
+                    "true",
+                )
+
+        def _update_clusterset_binding(item: Dict) -> None:
+            item["metadata"]["namespace"] = workload_name
+            item["metadata"]["name"] = self.config.clusterset
+            item["spec"]["clusterSet"] = self.config.clusterset
+
+        def _update_drpc(item: Dict) -> None:
+            if self.config.protect_workload != "yes":
+                return
+            item["metadata"]["name"] = f"{workload_name}-placs-drpc"
+            item["metadata"]["namespace"] = workload_name
+            item["spec"]["drPolicyRef"]["name"] = policy_name
+            item["spec"]["placementRef"]["name"] = f"{workload_name}-placs"
+            item["spec"]["placementRef"]["namespace"] = workload_name
+            item["spec"]["preferredCluster"] = workload_cluster
+
+            pvc_sel = item["spec"]["pvcSelector"]["matchExpressions"][0]
+            pvc_sel["key"] = self.workload_details.pvc_selector_key
+            pvc_sel["values"] = [self.workload_details.pvc_selector_value]
+
+            if self.config.cg:
+                item["metadata"].setdefault("annotations", {}).setdefault(
+                    "drplacementcontrol.ramendr.openshift.io/is-cg-enabled", "true"
+                )
+
+        # Constant-time dispatch on kind instead of an if/elif chain per item
+        handlers = {
+            "Namespace": _update_namespace,
+            "Application": _update_application,
+            "Channel": _update_channel,
+            "Subscription": _update_subscription,
+            "Placement": _update_placement,
+            "ManagedClusterSetBinding": _update_clusterset_binding,
+            "DRPlacementControl": _update_drpc,
+        }
+
+        for item in updated_data:
+            handler = handlers.get(item["kind"])
+            if handler:
+                handler(item)
 
         # Filter out DRPC if protection is disabled
         if self.config.protect_workload != "yes" or skip_dr_for_vm:
@@ -1858,12 +2416,13 @@ class WorkloadDeployer:
 
         return updated_data, workload_cluster
 
-    def _write_combined_output(self, yaml_docs: List[Dict]) -> None:
-        """Write all YAML documents to a single output file."""
-        if not yaml_docs:
-            logger.warning("⚠ No YAML documents generated")
-            return
+    def _write_workload_output(self, workload_name: str, docs: List[Dict]) -> None:
+        """Write one workload's documents to their own output file."""
+        output_file = self.config.output_dir_path / f"output_{workload_name}.yaml"
+        YAMLHelper.write(docs, output_file)
 
+    def _open_combined_output(self) -> StreamingYAMLWriter:
+        """Create the streaming writer for the combined output file."""
         ns_prefix = f"{self.config.ns_dr_prefix}_" if self.config.ns_dr_prefix else ""
         multi_suffix = (
             f"_multi{self.config.multi_ns_workload}"
@@ -1883,7 +2442,7 @@ class WorkloadDeployer:
         output_file = self.config.output_dir_path / file_name
 
         logger.info(f"\n💾 Writing combined YAML to: {output_file}")
-        YAMLHelper.write(yaml_docs, output_file)
+        return StreamingYAMLWriter(output_file)
 
 
 # --- Entry Point ---
@@ -1906,6 +2465,7 @@ def main():
         "round_robin": ClusterSelectionStrategy.ROUND_ROBIN,
         "random": ClusterSelectionStrategy.RANDOM,
         "least_loaded": ClusterSelectionStrategy.LEAST_LOADED,
+        "p2c": ClusterSelectionStrategy.P2C,
     }
     selection_strategy = strategy_map.get(
         getattr(args, "cluster_strategy", "round_robin"),
@@ -1934,6 +2494,9 @@ def main():
         selection_strategy=selection_strategy,
         multi_ns_workload=args.multi_ns_workload,
         vm_type=args.vm_type,
+        parallel=args.parallel,
+        seed=args.seed,
+        split_output=args.split_output,
     )
 
     # Deploy workloads